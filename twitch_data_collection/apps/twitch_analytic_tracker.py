@@ -1,32 +1,37 @@
 import os
-import time
+import sys
 import json
 import logging
 import datetime
 import pandas as pd
 import numpy as np
-import requests
 import boto3
 import io
-import schedule
+import gzip
 import threading
 import asyncio
+from collections import Counter, deque
+from concurrent.futures import ThreadPoolExecutor
+from botocore.config import Config
+from botocore.exceptions import ClientError
 from dotenv import load_dotenv
 from twitchAPI.twitch import Twitch
 from twitchAPI.oauth import UserAuthenticator
 # Instead of importing from twitchAPI.types, define constants directly
 from twitchAPI.chat import Chat, EventData, ChatMessage
-import websockets
 from flask import Flask, render_template, jsonify, request, send_from_directory
-import plotly.express as px
-import plotly.graph_objects as go
-from plotly.subplots import make_subplots
 import dash
 from dash import dcc, html
 from dash.dependencies import Input, Output
 import dash_bootstrap_components as dbc
 from dash_bootstrap_templates import load_figure_template
 
+# orjson is optional; fall back to the standard library encoder when it is missing
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 # Define Auth Scopes as constants instead of importing from twitchAPI.types
 class AuthScope:
     CHANNEL_READ_SUBSCRIPTIONS = "channel:read:subscriptions"
@@ -41,6 +46,58 @@ class ChatEvent:
     SUB = "subscription"
     RAID = "raid"
 
+# Display names for Twitch subscription plans (anything else, e.g. Prime, counts as Tier 1)
+SUB_TIER_NAMES = {
+    "1000": "Tier 1",
+    "2000": "Tier 2",
+    "3000": "Tier 3"
+}
+
+# Static insight/recommendation text for the daily report. The dicts are shared
+# between reports, so treat them as read-only and copy before adding a 'value'.
+RETENTION_ISSUE_INSIGHT = {
+    'type': 'retention_issue',
+    'message': "Strong viewer drop-off detected throughout stream"
+}
+RETENTION_POSITIVE_INSIGHT = {
+    'type': 'retention_positive',
+    'message': "Excellent viewer retention throughout stream"
+}
+ALGORITHM_BOOST_INSIGHT = {
+    'type': 'algorithm_boost',
+    'message': "Strong positive viewer growth rate indicates algorithm favor"
+}
+ALGORITHM_CONCERN_INSIGHT = {
+    'type': 'algorithm_concern',
+    'message': "Negative viewer trend may indicate algorithm deprioritization"
+}
+CONTENT_PACING_RECOMMENDATION = {
+    'type': 'content_pacing',
+    'message': "Consider introducing new content segments every 30 minutes to maintain viewer interest and improve algorithm ranking"
+}
+CONTENT_STRATEGY_RECOMMENDATION = {
+    'type': 'content_strategy',
+    'message': "This content format performs well for retention. Consider creating more similar content to maintain algorithm favor."
+}
+STREAM_DURATION_RECOMMENDATION = {
+    'type': 'stream_duration',
+    'message': "Consider extending streams by 30-60 minutes to capitalize on algorithm boost and increase discoverability"
+}
+CONTENT_VARIETY_RECOMMENDATION = {
+    'type': 'content_variety',
+    'message': "Increase content variety and engagement prompts to boost algorithm metrics"
+}
+
+# (predicate, insight, recommendation) rules; the first matching rule wins
+RETENTION_RULES = (
+    (lambda value: value < 50, RETENTION_ISSUE_INSIGHT, CONTENT_PACING_RECOMMENDATION),
+    (lambda value: value > 80, RETENTION_POSITIVE_INSIGHT, CONTENT_STRATEGY_RECOMMENDATION),
+)
+VIEWER_GROWTH_RULES = (
+    (lambda value: value > 5, ALGORITHM_BOOST_INSIGHT, STREAM_DURATION_RECOMMENDATION),
+    (lambda value: value < -5, ALGORITHM_CONCERN_INSIGHT, CONTENT_VARIETY_RECOMMENDATION),
+)
+
 # Load environment variables
 load_dotenv()
 
@@ -49,7 +106,7 @@ logging.basicConfig(
     level=logging.INFO,
     format='%(asctime)s - %(name)s - %(levelname)s - %(message)s',
     handlers=[
-        logging.FileHandler("twitch_analytics.log"),
+        logging.FileHandler("twitch_analytics.log", delay=True),
         logging.StreamHandler()
     ]
 )
@@ -66,6 +123,9 @@ AWS_ACCESS_KEY = os.getenv('AWS_ACCESS_KEY_ID')
 AWS_SECRET_KEY = os.getenv('AWS_SECRET_ACCESS_KEY')
 AWS_BUCKET_NAME = os.getenv('AWS_BUCKET_NAME')
 AWS_REGION = os.getenv('AWS_REGION', 'us-east-1')
+UPLOAD_QUEUE_SIZE = 512  # Queued single-object uploads before producers have to wait
+UPLOAD_WORKERS = 4
+UPLOAD_DRAIN_TIMEOUT = 30  # Seconds shutdown waits for queued uploads before backing them up locally
 
 # Create directories for backups if needed
 os.makedirs('data/backup', exist_ok=True)
@@ -74,9 +134,7 @@ os.makedirs('templates', exist_ok=True)
 
 # Initialize data structures for real-time tracking
 chat_messages = []
-viewer_counts = []
 subscriber_events = []
-stream_metrics = []
 channel_analytics = {}
 
 # Real-time metrics (for dashboard)
@@ -90,10 +148,10 @@ live_metrics = {
     'total_chat_messages': 0,
     'chat_messages_per_minute': 0,
     'unique_chatters': 0,
-    'viewer_retention': [],
-    'chat_activity': [],
-    'recent_subscribers': [],
-    'recent_events': []
+    'viewer_retention': deque(maxlen=60),
+    'chat_activity': deque(maxlen=30),
+    'recent_subscribers': deque(maxlen=20),
+    'recent_events': deque(maxlen=100)
 }
 
 # Global objects
@@ -290,8 +348,77 @@ dash_app.layout = dbc.Container([
 
 # Dash callbacks remain the same as in the original code
 
+def _json_default(value):
+    """Convert NumPy scalars that the JSON encoders cannot serialize natively"""
+    if isinstance(value, np.generic):
+        return value.item()
+    raise TypeError(f"Object of type {type(value).__name__} is not JSON serializable")
+
+def dump_json(data):
+    """Serialize data to compact JSON bytes for S3 uploads"""
+    if orjson is not None:
+        return orjson.dumps(data, default=_json_default, option=orjson.OPT_NON_STR_KEYS)
+    return json.dumps(data, separators=(',', ':'), default=_json_default).encode('utf-8')
+
+# Python 3.11+ fromisoformat understands the trailing 'Z' Twitch uses for UTC
+FROMISOFORMAT_ACCEPTS_Z = sys.version_info >= (3, 11)
+
+def parse_twitch_timestamp(timestamp):
+    """Parse an ISO 8601 UTC timestamp from the Twitch API (e.g. 2024-05-17T18:00:00Z)"""
+    if FROMISOFORMAT_ACCEPTS_Z:
+        return datetime.datetime.fromisoformat(timestamp)
+    return datetime.datetime.fromisoformat(timestamp.replace('Z', '+00:00'))
+
+def sort_by_timestamp(counts, timestamps):
+    """Return counts in chronological order, skipping the sort for already-ordered samples"""
+    timestamps = np.asarray(timestamps, dtype=str)
+    # Append-only writers almost always produce ordered data, so check that in O(n) first
+    if len(timestamps) < 2 or np.all(timestamps[:-1] <= timestamps[1:]):
+        return counts
+    return counts[np.argsort(timestamps, kind='stable')]
+
+def average_growth_rate(counts):
+    """Average percentage change between consecutive viewer counts"""
+    counts = np.asarray(counts, dtype=np.float64)
+    if len(counts) < 2:
+        return 0.0
+    
+    # Skip intervals that start from zero viewers (growth is undefined there)
+    previous = counts[:-1]
+    mask = previous > 0
+    if not mask.any():
+        return 0.0
+    
+    rates = (counts[1:][mask] - previous[mask]) / previous[mask] * 100
+    return float(rates.mean())
+
+def apply_insight_rules(report, rules, value):
+    """Append the insight and recommendation of the first rule matching value"""
+    for predicate, insight, recommendation in rules:
+        if predicate(value):
+            report['insights'].append({**insight, 'value': value})
+            report['recommendations'].append(recommendation)
+            break
+
 class TwitchAnalyticsTracker:
     def __init__(self):
+        # Every S3 key is rooted at the lowercased broadcaster name
+        self._broadcaster_prefix = BROADCASTER_NAME.lower()
+        # Per-tracker buffers, flushed and emptied by save_viewer_stats / save_stream_metrics
+        self.viewer_counts = []
+        self.stream_metrics = []
+        # Parsed form of live_metrics['stream_started_at'], set once when a stream starts
+        self._stream_start_dt = None
+        # Date of the last offline status written, so an idle channel logs one marker per day
+        self._last_saved_offline_date = None
+        # Everyone who has chatted this stream; chat_messages only holds the unsaved batch
+        self._chatters = set()
+        # Subscriber count last written to S3; unchanged samples are not re-uploaded
+        self._last_saved_sub_count = None
+        # Daily-CSV rows whose append failed, keyed by (folder, date) and retried on the next flush
+        self._pending_daily_frames = {}
+        # Single-object uploads are queued here and drained by upload_worker tasks
+        self._upload_queue = asyncio.Queue(maxsize=UPLOAD_QUEUE_SIZE)
         self.initialize_connections()
         
     def initialize_connections(self):
@@ -318,7 +445,7 @@ class TwitchAnalyticsTracker:
         # Get broadcaster ID
         user_info = twitch.get_users(logins=[BROADCASTER_NAME])
         broadcaster_id = user_info['data'][0]['id']
-        logger.info(f"Broadcaster ID for {BROADCASTER_NAME}: {broadcaster_id}")
+        logger.info("Broadcaster ID for %s: %s", BROADCASTER_NAME, broadcaster_id)
         
         # Initialize AWS S3 connection
         logger.info("Initializing AWS S3 connection...")
@@ -326,7 +453,15 @@ class TwitchAnalyticsTracker:
             's3',
             aws_access_key_id=AWS_ACCESS_KEY,
             aws_secret_access_key=AWS_SECRET_KEY,
-            region_name=AWS_REGION
+            region_name=AWS_REGION,
+            # Uploads overlap across worker threads; keep enough warm keep-alive connections
+            # for them. Adaptive retries back off on throttling, 5xx and connection errors
+            # and fail fast on permanent errors such as AccessDenied
+            config=Config(
+                max_pool_connections=20,
+                retries={'max_attempts': 6, 'mode': 'adaptive'},
+                tcp_keepalive=True
+            )
         )
         
         # Set up S3 bucket for analytics data
@@ -340,9 +475,9 @@ class TwitchAnalyticsTracker:
             # Check if bucket exists, if not create it
             try:
                 s3_client.head_bucket(Bucket=AWS_BUCKET_NAME)
-                logger.info(f"S3 bucket {AWS_BUCKET_NAME} exists")
-            except:
-                logger.info(f"Creating S3 bucket {AWS_BUCKET_NAME}")
+                logger.info("S3 bucket %s exists", AWS_BUCKET_NAME)
+            except ClientError:
+                logger.info("Creating S3 bucket %s", AWS_BUCKET_NAME)
                 if AWS_REGION == 'us-east-1':
                     s3_client.create_bucket(Bucket=AWS_BUCKET_NAME)
                 else:
@@ -353,27 +488,107 @@ class TwitchAnalyticsTracker:
             
             # Create folder structure in S3
             folders = [
-                f"{BROADCASTER_NAME.lower()}/subscribers/",
-                f"{BROADCASTER_NAME.lower()}/chat_metrics/",
-                f"{BROADCASTER_NAME.lower()}/viewer_stats/",
-                f"{BROADCASTER_NAME.lower()}/stream_metrics/",
-                f"{BROADCASTER_NAME.lower()}/reports/",
-                f"{BROADCASTER_NAME.lower()}/raw_events/"
+                f"{self._broadcaster_prefix}/subscribers/",
+                f"{self._broadcaster_prefix}/chat_metrics/",
+                f"{self._broadcaster_prefix}/viewer_stats/",
+                f"{self._broadcaster_prefix}/stream_metrics/",
+                f"{self._broadcaster_prefix}/reports/",
+                f"{self._broadcaster_prefix}/raw_events/"
             ]
             
             for folder in folders:
                 s3_client.put_object(Bucket=AWS_BUCKET_NAME, Key=folder)
             
-            logger.info(f"S3 folder structure set up for {BROADCASTER_NAME}")
+            logger.info("S3 folder structure set up for %s", BROADCASTER_NAME)
             
         except Exception as e:
-            logger.error(f"Error setting up S3 bucket: {str(e)}")
+            logger.error("Error setting up S3 bucket: %s", e)
+    
+    def put_bytes(self, s3_key, body, content_type, compress=False):
+        """Upload an encoded body to S3, gzip-compressed when requested"""
+        if compress:
+            # Level 1 costs almost no CPU but still shrinks JSON several-fold on the wire.
+            # Compressed keys end in .gz so readers such as pandas and Athena decompress them
+            body = gzip.compress(body, compresslevel=1)
+            content_type = 'application/gzip'
+        
+        s3_client.put_object(
+            Bucket=AWS_BUCKET_NAME,
+            Key=s3_key,
+            Body=body,
+            ContentType=content_type
+        )
+    
+    def put_json(self, s3_key, data, compress=False):
+        """Upload data to S3 as a single JSON document"""
+        self.put_bytes(s3_key, dump_json(data), 'application/json', compress)
+    
+    def put_ndjson(self, s3_key, records, compress=False):
+        """Upload records to S3 as newline-delimited JSON, one object per line"""
+        body = b''.join(dump_json(record) + b'\n' for record in records)
+        self.put_bytes(s3_key, body, 'application/x-ndjson', compress)
+    
+    async def enqueue_upload(self, s3_key, body, content_type, backup_path=None, on_success=None):
+        """Queue an upload for the upload workers, waiting only while the queue is full"""
+        put_kwargs = {
+            'Bucket': AWS_BUCKET_NAME,
+            'Key': s3_key,
+            'Body': body,
+            'ContentType': content_type
+        }
+        # Anything that never reaches S3 is kept locally, mirroring its key unless told otherwise
+        backup_path = backup_path or os.path.join('data', 'backup', s3_key)
+        await self._upload_queue.put((put_kwargs, backup_path, on_success))
+    
+    async def upload_worker(self):
+        """Drain the upload queue, keeping a local copy of uploads that still fail after retries"""
+        while True:
+            put_kwargs, backup_path, on_success = await self._upload_queue.get()
+            try:
+                await asyncio.to_thread(s3_client.put_object, **put_kwargs)
+                logger.debug("Saved %s to S3", put_kwargs['Key'])
+                if on_success:
+                    on_success()
+            except asyncio.CancelledError:
+                # Shutdown gave up on this upload; the PUT may not have landed, so keep a copy
+                self.write_upload_backup(put_kwargs, backup_path)
+                raise
+            except Exception as e:
+                logger.error("Error saving %s to S3: %s", put_kwargs['Key'], e)
+                self.write_upload_backup(put_kwargs, backup_path)
+            finally:
+                self._upload_queue.task_done()
+    
+    def write_upload_backup(self, put_kwargs, backup_path):
+        """Write an upload's body to its local backup path"""
+        try:
+            os.makedirs(os.path.dirname(backup_path), exist_ok=True)
+            with open(backup_path, 'wb') as f:
+                f.write(put_kwargs['Body'])
+        except OSError as backup_error:
+            logger.error("Error writing local backup %s: %s", backup_path, backup_error)
+    
+    async def stop_upload_workers(self):
+        """Let queued uploads finish, then stop the workers and back up whatever is left"""
+        try:
+            await asyncio.wait_for(self._upload_queue.join(), UPLOAD_DRAIN_TIMEOUT)
+        except asyncio.TimeoutError:
+            logger.warning("Timed out draining uploads with %s still queued", self._upload_queue.qsize())
+        
+        for worker in self._upload_workers:
+            worker.cancel()
+        await asyncio.gather(*self._upload_workers, return_exceptions=True)
+        
+        while not self._upload_queue.empty():
+            put_kwargs, backup_path, _ = self._upload_queue.get_nowait()
+            self.write_upload_backup(put_kwargs, backup_path)
+            self._upload_queue.task_done()
     
     async def connect_to_chat(self):
         """Connect to Twitch chat and set up event handlers"""
         global chat
         
-        logger.info(f"Connecting to Twitch chat for channel: {TARGET_CHANNEL}")
+        logger.info("Connecting to Twitch chat for channel: %s", TARGET_CHANNEL)
         chat = await Chat(twitch, initial_channels=[TARGET_CHANNEL])
         
         # Register event handlers
@@ -385,7 +600,8 @@ class TwitchAnalyticsTracker:
     
     async def on_chat_message(self, event_data: EventData, message: ChatMessage):
         """Handle chat messages with immediate AWS storage"""
-        timestamp = datetime.datetime.now().isoformat()
+        now = datetime.datetime.now()
+        timestamp = now.isoformat()
         
         # Create message data
         message_data = {
@@ -409,8 +625,8 @@ class TwitchAnalyticsTracker:
         live_metrics['total_chat_messages'] += 1
         
         # Add unique chatter if not seen before
-        unique_chatters = set(msg['sender'] for msg in chat_messages)
-        live_metrics['unique_chatters'] = len(unique_chatters)
+        self._chatters.add(message.sender.name)
+        live_metrics['unique_chatters'] = len(self._chatters)
         
         # Add to recent events
         live_metrics['recent_events'].append({
@@ -421,31 +637,23 @@ class TwitchAnalyticsTracker:
         
         # Update chat activity for the dashboard
         # Group by minute for the chart
-        current_minute = datetime.datetime.now().replace(second=0, microsecond=0).isoformat()
-        
-        # Find or create a minute entry
-        minute_exists = False
-        for minute_data in live_metrics['chat_activity']:
-            if minute_data['timestamp'] == current_minute:
-                minute_data['message_count'] += 1
-                minute_exists = True
-                break
-                
-        if not minute_exists:
-            live_metrics['chat_activity'].append({
+        current_minute = now.replace(second=0, microsecond=0).isoformat()
+        
+        # Minutes only move forward, so the current one can only be the newest entry
+        chat_activity = live_metrics['chat_activity']
+        if chat_activity and chat_activity[-1]['timestamp'] == current_minute:
+            chat_activity[-1]['message_count'] += 1
+        else:
+            chat_activity.append({
                 'timestamp': current_minute,
                 'message_count': 1
             })
-            
-            # Keep only the last 30 minutes
-            if len(live_metrics['chat_activity']) > 30:
-                live_metrics['chat_activity'] = live_metrics['chat_activity'][-30:]
         
         # Calculate messages per minute
-        if live_metrics['is_live'] and live_metrics['stream_started_at']:
-            total_minutes = max(1, (datetime.datetime.now() - datetime.datetime.fromisoformat(
-                live_metrics['stream_started_at'].replace('Z', '+00:00')
-            )).total_seconds() / 60)
+        if live_metrics['is_live'] and self._stream_start_dt:
+            # Same instant as the message's timestamp; the naive local time is converted to UTC
+            elapsed = now.astimezone(datetime.timezone.utc) - self._stream_start_dt
+            total_minutes = max(1, elapsed.total_seconds() / 60)
             
             live_metrics['chat_messages_per_minute'] = live_metrics['total_chat_messages'] / total_minutes
         
@@ -477,16 +685,8 @@ class TwitchAnalyticsTracker:
         live_metrics['new_subs_today'] += 1
         live_metrics['recent_subscribers'].append(sub_data)
         
-        # Keep only the last 20 subscribers
-        if len(live_metrics['recent_subscribers']) > 20:
-            live_metrics['recent_subscribers'] = live_metrics['recent_subscribers'][-20:]
-        
         # Add to recent events
-        tier_name = "Tier 1"
-        if sub_data['tier'] == "2000":
-            tier_name = "Tier 2"
-        elif sub_data['tier'] == "3000":
-            tier_name = "Tier 3"
+        tier_name = SUB_TIER_NAMES.get(sub_data['tier'], "Tier 1")
             
         event_message = f"{sub_data['user']} subscribed ({tier_name})"
         if sub_data['is_gift']:
@@ -500,11 +700,7 @@ class TwitchAnalyticsTracker:
             'message': event_message
         })
         
-        # Keep only the last 100 events
-        if len(live_metrics['recent_events']) > 100:
-            live_metrics['recent_events'] = live_metrics['recent_events'][-100:]
-        
-        logger.info(f"New subscription: {event_data.user.name}")
+        logger.info("New subscription: %s", event_data.user.name)
         
         # Immediately save subscriber data to S3
         await self.save_subscriber_data()
@@ -531,14 +727,10 @@ class TwitchAnalyticsTracker:
             'message': f"{raid_data['raider']} raided with {raid_data['viewer_count']} viewers"
         })
         
-        # Keep only the last 100 events
-        if len(live_metrics['recent_events']) > 100:
-            live_metrics['recent_events'] = live_metrics['recent_events'][-100:]
-        
-        logger.info(f"Raid received from {raid_data['raider']} with {raid_data['viewer_count']} viewers")
+        logger.info("Raid received from %s with %s viewers", raid_data['raider'], raid_data['viewer_count'])
 
     async def save_event_to_s3(self, event_type, event_data):
-        """Save event data directly to S3"""
+        """Queue event data for upload to S3"""
         try:
             timestamp = datetime.datetime.now()
             date_str = timestamp.strftime("%Y%m%d")
@@ -546,46 +738,60 @@ class TwitchAnalyticsTracker:
             
             # Create a unique key for this event
             event_id = f"{int(timestamp.timestamp() * 1000)}_{hash(str(event_data))}"
-            s3_key = f"{BROADCASTER_NAME.lower()}/raw_events/{date_str}/{hour_str}/{event_type}_{event_id}.json"
+            s3_key = f"{self._broadcaster_prefix}/raw_events/{date_str}/{hour_str}/{event_type}_{event_id}.json"
             
-            # Convert data to JSON and save directly to S3
-            json_data = json.dumps(event_data)
-            s3_client.put_object(
-                Bucket=AWS_BUCKET_NAME,
-                Key=s3_key,
-                Body=json_data,
-                ContentType='application/json'
+            # The upload workers send it to S3 and fall back to a local backup if that fails
+            await self.enqueue_upload(
+                s3_key,
+                dump_json(event_data),
+                'application/json',
+                backup_path=f'data/backup/{date_str}/{event_type}_{event_id}.json'
             )
             
-            logger.debug(f"Saved {event_type} event to S3: {s3_key}")
-            
         except Exception as e:
-            logger.error(f"Error saving {event_type} event to S3: {str(e)}")
-            # Create a backup locally just in case
-            try:
-                os.makedirs(f'data/backup/{date_str}', exist_ok=True)
-                with open(f'data/backup/{date_str}/{event_type}_{event_id}.json', 'w') as f:
-                    json.dump(event_data, f)
-            except:
-                pass
+            logger.error("Error queueing %s event for S3: %s", event_type, e)
 
     async def save_chat_metrics(self):
         """Save chat message data directly to S3"""
         if not chat_messages:
             return
         
+        # Take ownership of the current batch so records arriving during the uploads are kept
+        batch = chat_messages.copy()
+        chat_messages.clear()
+        try:
+            await self._upload_chat_metrics(batch)
+        except Exception:
+            # Put the batch back ahead of newer records so the next flush retries it
+            chat_messages[:0] = batch
+            raise
+
+    async def _upload_chat_metrics(self, batch):
+        """Upload a batch of chat messages and its metrics to S3"""
         timestamp = datetime.datetime.now()
-        date_str = timestamp.strftime("%Y%m%d")
-        hour_str = timestamp.strftime("%H")
-        
-        # Prepare data for metrics
-        unique_chatters = set(msg['sender'] for msg in chat_messages)
-        total_messages = len(chat_messages)
+        date_str, time_str = timestamp.strftime("%Y%m%d %H%M%S").split()
+        
+        # Prepare data for metrics in a single pass over the batch
+        unique_chatters = set()
+        subscriber_messages = 0
+        mod_messages = 0
+        timestamp_min = timestamp_max = batch[0]['timestamp']
+        for msg in batch:
+            unique_chatters.add(msg['sender'])
+            if msg['is_subscriber']:
+                subscriber_messages += 1
+            if msg['is_mod']:
+                mod_messages += 1
+            if msg['timestamp'] < timestamp_min:
+                timestamp_min = msg['timestamp']
+            elif msg['timestamp'] > timestamp_max:
+                timestamp_max = msg['timestamp']
+        total_messages = len(batch)
         
         # Calculate chat velocity (messages per minute)
-        if len(chat_messages) >= 2:
-            first_msg_time = datetime.datetime.fromisoformat(chat_messages[0]['timestamp'])
-            last_msg_time = datetime.datetime.fromisoformat(chat_messages[-1]['timestamp'])
+        if len(batch) >= 2:
+            first_msg_time = datetime.datetime.fromisoformat(batch[0]['timestamp'])
+            last_msg_time = datetime.datetime.fromisoformat(batch[-1]['timestamp'])
             duration_minutes = max(1, (last_msg_time - first_msg_time).total_seconds() / 60)
             chat_velocity = total_messages / duration_minutes
         else:
@@ -597,54 +803,34 @@ class TwitchAnalyticsTracker:
             'message_count': total_messages,
             'unique_chatters': len(unique_chatters),
             'chat_velocity': chat_velocity,
-            'subscriber_ratio': sum(1 for msg in chat_messages if msg['is_subscriber']) / total_messages if total_messages > 0 else 0,
-            'mod_message_count': sum(1 for msg in chat_messages if msg['is_mod']),
-            'timestamp_min': min(msg['timestamp'] for msg in chat_messages),
-            'timestamp_max': max(msg['timestamp'] for msg in chat_messages)
+            'subscriber_ratio': subscriber_messages / total_messages,
+            'mod_message_count': mod_messages,
+            'timestamp_min': timestamp_min,
+            'timestamp_max': timestamp_max
         }
         
         # Save metrics directly to S3
-        metrics_key = f"{BROADCASTER_NAME.lower()}/chat_metrics/{date_str}/metrics_{timestamp.strftime('%H%M%S')}.json"
-        s3_client.put_object(
+        metrics_key = f"{self._broadcaster_prefix}/chat_metrics/{date_str}/metrics_{time_str}.json"
+        await asyncio.to_thread(
+            s3_client.put_object,
             Bucket=AWS_BUCKET_NAME,
             Key=metrics_key,
-            Body=json.dumps(chat_metrics),
+            Body=dump_json(chat_metrics),
             ContentType='application/json'
         )
         
-        # Save the raw chat messages batch
-        batch_key = f"{BROADCASTER_NAME.lower()}/chat_metrics/{date_str}/raw_batch_{timestamp.strftime('%H%M%S')}.json"
-        
-        # For larger datasets, stream directly to S3
-        if len(chat_messages) > 1000:
-            # Stream JSON data to S3
-            buffer = io.BytesIO()
-            for message in chat_messages:
-                buffer.write((json.dumps(message) + '\n').encode('utf-8'))
-            
-            buffer.seek(0)
-            s3_client.put_object(
-                Bucket=AWS_BUCKET_NAME,
-                Key=batch_key,
-                Body=buffer.getvalue(),
-                ContentType='application/json'
-            )
-        else:
-            # For smaller batches, save directly
-            s3_client.put_object(
-                Bucket=AWS_BUCKET_NAME,
-                Key=batch_key,
-                Body=json.dumps(chat_messages),
-                ContentType='application/json'
-            )
+        # Save the raw chat messages batch, one message per line
+        batch_key = f"{self._broadcaster_prefix}/chat_metrics/{date_str}/raw_batch_{time_str}.jsonl.gz"
+        await asyncio.to_thread(self.put_ndjson, batch_key, batch, compress=True)
         
         # Also save as CSV for analytics tools
-        csv_data = pd.DataFrame(chat_messages)
+        csv_data = pd.DataFrame(batch)
         csv_buffer = io.StringIO()
         csv_data.to_csv(csv_buffer, index=False)
         
-        csv_key = f"{BROADCASTER_NAME.lower()}/chat_metrics/{date_str}/messages_{timestamp.strftime('%H%M%S')}.csv"
-        s3_client.put_object(
+        csv_key = f"{self._broadcaster_prefix}/chat_metrics/{date_str}/messages_{time_str}.csv"
+        await asyncio.to_thread(
+            s3_client.put_object,
             Bucket=AWS_BUCKET_NAME,
             Key=csv_key,
             Body=csv_buffer.getvalue(),
@@ -652,70 +838,42 @@ class TwitchAnalyticsTracker:
         )
         
         # Save a continuous daily record by appending to a consolidated file
-        try:
-            # Check if daily file exists
-            daily_key = f"{BROADCASTER_NAME.lower()}/chat_metrics/daily_{date_str}.csv"
-            
-            try:
-                # Try to get the existing file
-                existing_obj = s3_client.get_object(Bucket=AWS_BUCKET_NAME, Key=daily_key)
-                daily_exists = True
-            except:
-                daily_exists = False
-            
-            # Create a new CSV buffer with header only if it's a new file
-            daily_buffer = io.StringIO()
-            csv_data.to_csv(daily_buffer, index=False, header=not daily_exists)
-            
-            # If the file exists, append to it
-            if daily_exists:
-                s3_client.put_object(
-                    Bucket=AWS_BUCKET_NAME,
-                    Key=daily_key,
-                    Body=daily_buffer.getvalue().split("\n", 1)[1],  # Skip header line
-                    ContentType='text/csv',
-                    Metadata={'append': 'true'}
-                )
-            else:
-                # New file
-                s3_client.put_object(
-                    Bucket=AWS_BUCKET_NAME,
-                    Key=daily_key,
-                    Body=daily_buffer.getvalue(),
-                    ContentType='text/csv'
-                )
-        except Exception as e:
-            logger.error(f"Error appending to daily chat file: {str(e)}")
+        await self.append_daily_csv('chat_metrics', date_str, csv_data, "chat")
         
-        # Clear processed messages
-        chat_messages.clear()
-        
-        logger.info(f"Saved chat metrics directly to S3")
+        logger.info("Saved chat metrics directly to S3")
 
     async def save_subscriber_data(self):
         """Save subscriber data directly to S3"""
         if not subscriber_events:
             return
         
+        # Take ownership of the current batch so records arriving during the uploads are kept
+        batch = subscriber_events.copy()
+        subscriber_events.clear()
+        try:
+            await self._upload_subscriber_data(batch)
+        except Exception:
+            # Put the batch back ahead of newer records so the next flush retries it
+            subscriber_events[:0] = batch
+            raise
+
+    async def _upload_subscriber_data(self, batch):
+        """Upload a batch of subscriber events to S3"""
         timestamp = datetime.datetime.now()
-        date_str = timestamp.strftime("%Y%m%d")
+        date_str, time_str = timestamp.strftime("%Y%m%d %H%M%S").split()
         
-        # Save to S3 as JSON
-        s3_key = f"{BROADCASTER_NAME.lower()}/subscribers/{date_str}/subscribers_{timestamp.strftime('%H%M%S')}.json"
-        s3_client.put_object(
-            Bucket=AWS_BUCKET_NAME,
-            Key=s3_key,
-            Body=json.dumps(subscriber_events),
-            ContentType='application/json'
-        )
+        # Save to S3 as newline-delimited JSON
+        s3_key = f"{self._broadcaster_prefix}/subscribers/{date_str}/subscribers_{time_str}.jsonl.gz"
+        await asyncio.to_thread(self.put_ndjson, s3_key, batch, compress=True)
         
         # Also save as CSV for analytics tools
-        subs_df = pd.DataFrame(subscriber_events)
+        subs_df = pd.DataFrame(batch)
         csv_buffer = io.StringIO()
         subs_df.to_csv(csv_buffer, index=False)
         
-        csv_key = f"{BROADCASTER_NAME.lower()}/subscribers/{date_str}/subscribers_{timestamp.strftime('%H%M%S')}.csv"
-        s3_client.put_object(
+        csv_key = f"{self._broadcaster_prefix}/subscribers/{date_str}/subscribers_{time_str}.csv"
+        await asyncio.to_thread(
+            s3_client.put_object,
             Bucket=AWS_BUCKET_NAME,
             Key=csv_key,
             Body=csv_buffer.getvalue(),
@@ -723,70 +881,42 @@ class TwitchAnalyticsTracker:
         )
         
         # Also append to daily file
-        try:
-            # Check if daily file exists
-            daily_key = f"{BROADCASTER_NAME.lower()}/subscribers/daily_{date_str}.csv"
-            
-            try:
-                # Try to get the existing file
-                existing_obj = s3_client.get_object(Bucket=AWS_BUCKET_NAME, Key=daily_key)
-                daily_exists = True
-            except:
-                daily_exists = False
-            
-            # Create a new CSV buffer with header only if it's a new file
-            daily_buffer = io.StringIO()
-            subs_df.to_csv(daily_buffer, index=False, header=not daily_exists)
-            
-            # If the file exists, append to it
-            if daily_exists:
-                s3_client.put_object(
-                    Bucket=AWS_BUCKET_NAME,
-                    Key=daily_key,
-                    Body=daily_buffer.getvalue().split("\n", 1)[1],  # Skip header line
-                    ContentType='text/csv',
-                    Metadata={'append': 'true'}
-                )
-            else:
-                # New file
-                s3_client.put_object(
-                    Bucket=AWS_BUCKET_NAME,
-                    Key=daily_key,
-                    Body=daily_buffer.getvalue(),
-                    ContentType='text/csv'
-                )
-        except Exception as e:
-            logger.error(f"Error appending to daily subscribers file: {str(e)}")
+        await self.append_daily_csv('subscribers', date_str, subs_df, "subscribers")
         
-        # Clear processed events
-        subscriber_events.clear()
-        
-        logger.info(f"Saved subscriber data directly to S3")
+        logger.info("Saved subscriber data directly to S3")
 
     async def save_viewer_stats(self):
         """Save viewer statistics directly to S3"""
-        if not viewer_counts:
+        if not self.viewer_counts:
             return
         
+        # Take ownership of the current batch so records arriving during the uploads are kept
+        batch = self.viewer_counts.copy()
+        self.viewer_counts.clear()
+        try:
+            await self._upload_viewer_stats(batch)
+        except Exception:
+            # Put the batch back ahead of newer records so the next flush retries it
+            self.viewer_counts[:0] = batch
+            raise
+
+    async def _upload_viewer_stats(self, batch):
+        """Upload a batch of viewer counts to S3"""
         timestamp = datetime.datetime.now()
-        date_str = timestamp.strftime("%Y%m%d")
+        date_str, time_str = timestamp.strftime("%Y%m%d %H%M%S").split()
         
-        # Save to S3 as JSON
-        s3_key = f"{BROADCASTER_NAME.lower()}/viewer_stats/{date_str}/viewers_{timestamp.strftime('%H%M%S')}.json"
-        s3_client.put_object(
-            Bucket=AWS_BUCKET_NAME,
-            Key=s3_key,
-            Body=json.dumps(viewer_counts),
-            ContentType='application/json'
-        )
+        # Save to S3 as newline-delimited JSON
+        s3_key = f"{self._broadcaster_prefix}/viewer_stats/{date_str}/viewers_{time_str}.jsonl.gz"
+        await asyncio.to_thread(self.put_ndjson, s3_key, batch, compress=True)
         
         # Also save as CSV for analytics tools
-        viewer_df = pd.DataFrame(viewer_counts)
+        viewer_df = pd.DataFrame(batch)
         csv_buffer = io.StringIO()
         viewer_df.to_csv(csv_buffer, index=False)
         
-        csv_key = f"{BROADCASTER_NAME.lower()}/viewer_stats/{date_str}/viewers_{timestamp.strftime('%H%M%S')}.csv"
-        s3_client.put_object(
+        csv_key = f"{self._broadcaster_prefix}/viewer_stats/{date_str}/viewers_{time_str}.csv"
+        await asyncio.to_thread(
+            s3_client.put_object,
             Bucket=AWS_BUCKET_NAME,
             Key=csv_key,
             Body=csv_buffer.getvalue(),
@@ -794,70 +924,42 @@ class TwitchAnalyticsTracker:
         )
         
         # Also append to daily file
-        try:
-            # Check if daily file exists
-            daily_key = f"{BROADCASTER_NAME.lower()}/viewer_stats/daily_{date_str}.csv"
-            
-            try:
-                # Try to get the existing file
-                existing_obj = s3_client.get_object(Bucket=AWS_BUCKET_NAME, Key=daily_key)
-                daily_exists = True
-            except:
-                daily_exists = False
-            
-            # Create a new CSV buffer with header only if it's a new file
-            daily_buffer = io.StringIO()
-            viewer_df.to_csv(daily_buffer, index=False, header=not daily_exists)
-            
-            # If the file exists, append to it
-            if daily_exists:
-                s3_client.put_object(
-                    Bucket=AWS_BUCKET_NAME,
-                    Key=daily_key,
-                    Body=daily_buffer.getvalue().split("\n", 1)[1],  # Skip header line
-                    ContentType='text/csv',
-                    Metadata={'append': 'true'}
-                )
-            else:
-                # New file
-                s3_client.put_object(
-                    Bucket=AWS_BUCKET_NAME,
-                    Key=daily_key,
-                    Body=daily_buffer.getvalue(),
-                    ContentType='text/csv'
-                )
-        except Exception as e:
-            logger.error(f"Error appending to daily viewer stats file: {str(e)}")
-        
-        # Clear processed viewer counts
-        viewer_counts.clear()
+        await self.append_daily_csv('viewer_stats', date_str, viewer_df, "viewer stats")
         
-        logger.info(f"Saved viewer statistics directly to S3")
+        logger.info("Saved viewer statistics directly to S3")
 
     async def save_stream_metrics(self):
         """Save stream metrics directly to S3"""
-        if not stream_metrics:
+        if not self.stream_metrics:
             return
         
+        # Take ownership of the current batch so records arriving during the uploads are kept
+        batch = self.stream_metrics.copy()
+        self.stream_metrics.clear()
+        try:
+            await self._upload_stream_metrics(batch)
+        except Exception:
+            # Put the batch back ahead of newer records so the next flush retries it
+            self.stream_metrics[:0] = batch
+            raise
+
+    async def _upload_stream_metrics(self, batch):
+        """Upload a batch of stream metrics to S3"""
         timestamp = datetime.datetime.now()
-        date_str = timestamp.strftime("%Y%m%d")
+        date_str, time_str = timestamp.strftime("%Y%m%d %H%M%S").split()
         
-        # Save to S3 as JSON
-        s3_key = f"{BROADCASTER_NAME.lower()}/stream_metrics/{date_str}/metrics_{timestamp.strftime('%H%M%S')}.json"
-        s3_client.put_object(
-            Bucket=AWS_BUCKET_NAME,
-            Key=s3_key,
-            Body=json.dumps(stream_metrics),
-            ContentType='application/json'
-        )
+        # Save to S3 as newline-delimited JSON
+        s3_key = f"{self._broadcaster_prefix}/stream_metrics/{date_str}/metrics_{time_str}.jsonl.gz"
+        await asyncio.to_thread(self.put_ndjson, s3_key, batch, compress=True)
         
         # Also save as CSV for analytics tools
-        metrics_df = pd.DataFrame(stream_metrics)
+        metrics_df = pd.DataFrame(batch)
         csv_buffer = io.StringIO()
         metrics_df.to_csv(csv_buffer, index=False)
         
-        csv_key = f"{BROADCASTER_NAME.lower()}/stream_metrics/{date_str}/metrics_{timestamp.strftime('%H%M%S')}.csv"
-        s3_client.put_object(
+        csv_key = f"{self._broadcaster_prefix}/stream_metrics/{date_str}/metrics_{time_str}.csv"
+        await asyncio.to_thread(
+            s3_client.put_object,
             Bucket=AWS_BUCKET_NAME,
             Key=csv_key,
             Body=csv_buffer.getvalue(),
@@ -865,45 +967,68 @@ class TwitchAnalyticsTracker:
         )
         
         # Also append to daily file
-        try:
-            # Check if daily file exists
-            daily_key = f"{BROADCASTER_NAME.lower()}/stream_metrics/daily_{date_str}.csv"
-            
+        await self.append_daily_csv('stream_metrics', date_str, metrics_df, "stream metrics")
+        
+        logger.info("Saved stream metrics directly to S3")
+
+    async def append_daily_csv(self, folder, date_str, frame, description):
+        """Append rows to a consolidated daily CSV, holding them for the next flush if the write fails"""
+        self._pending_daily_frames.setdefault((folder, date_str), []).append(frame)
+        
+        # Rows left over from an earlier failed append are retried here on their own, so the
+        # per-flush objects of their batch, which did reach S3, are not written again
+        for pending_key in [key for key in self._pending_daily_frames if key[0] == folder]:
+            frames = self._pending_daily_frames.pop(pending_key)
+            daily_data = frames[0] if len(frames) == 1 else pd.concat(frames, ignore_index=True)
+            daily_key = f"{self._broadcaster_prefix}/{folder}/daily_{pending_key[1]}.csv"
             try:
-                # Try to get the existing file
-                existing_obj = s3_client.get_object(Bucket=AWS_BUCKET_NAME, Key=daily_key)
-                daily_exists = True
-            except:
-                daily_exists = False
-            
-            # Create a new CSV buffer with header only if it's a new file
-            daily_buffer = io.StringIO()
-            metrics_df.to_csv(daily_buffer, index=False, header=not daily_exists)
-            
-            # If the file exists, append to it
-            if daily_exists:
-                s3_client.put_object(
-                    Bucket=AWS_BUCKET_NAME,
-                    Key=daily_key,
-                    Body=daily_buffer.getvalue().split("\n", 1)[1],  # Skip header line
-                    ContentType='text/csv',
-                    Metadata={'append': 'true'}
-                )
-            else:
-                # New file
-                s3_client.put_object(
-                    Bucket=AWS_BUCKET_NAME,
-                    Key=daily_key,
-                    Body=daily_buffer.getvalue(),
-                    ContentType='text/csv'
-                )
+                try:
+                    # Only the object's existence matters, so HEAD it instead of opening a download
+                    await asyncio.to_thread(s3_client.head_object, Bucket=AWS_BUCKET_NAME, Key=daily_key)
+                    daily_exists = True
+                except ClientError:
+                    daily_exists = False
+                
+                # Create a new CSV buffer with header only if it's a new file
+                daily_buffer = io.StringIO()
+                daily_data.to_csv(daily_buffer, index=False, header=not daily_exists)
+                
+                # If the file exists, append to it
+                if daily_exists:
+                    await asyncio.to_thread(
+                        s3_client.put_object,
+                        Bucket=AWS_BUCKET_NAME,
+                        Key=daily_key,
+                        Body=daily_buffer.getvalue().split("\n", 1)[1],  # Skip header line
+                        ContentType='text/csv',
+                        Metadata={'append': 'true'}
+                    )
+                else:
+                    # New file
+                    await asyncio.to_thread(
+                        s3_client.put_object,
+                        Bucket=AWS_BUCKET_NAME,
+                        Key=daily_key,
+                        Body=daily_buffer.getvalue(),
+                        ContentType='text/csv'
+                    )
+            except Exception as e:
+                logger.error("Error appending to daily %s file: %s", description, e)
+                # Keep the rows ahead of any queued meanwhile so the next flush retries them first
+                self._pending_daily_frames.setdefault(pending_key, [])[:0] = frames
+
+    def load_daily_csv(self, folder, date_str, description, columns=None):
+        """Load a consolidated daily CSV from S3, returning None if unavailable"""
+        daily_key = f"{self._broadcaster_prefix}/{folder}/daily_{date_str}.csv"
+        try:
+            daily_obj = s3_client.get_object(Bucket=AWS_BUCKET_NAME, Key=daily_key)
+            # Only materialize the columns the report uses; a callable tolerates missing ones
+            usecols = (lambda column: column in columns) if columns else None
+            # Parse straight from the response stream instead of buffering a full copy first
+            return pd.read_csv(daily_obj['Body'], usecols=usecols)
         except Exception as e:
-            logger.error(f"Error appending to daily stream metrics file: {str(e)}")
-        
-        # Clear processed metrics
-        stream_metrics.clear()
-        
-        logger.info(f"Saved stream metrics directly to S3")
+            logger.warning("Could not load %s from S3: %s", description, e)
+            return None
 
     def generate_daily_report(self):
         """Generate a daily analytics report with insights for algorithm optimization"""
@@ -912,41 +1037,20 @@ class TwitchAnalyticsTracker:
         
         # Try to load data from S3
         try:
-            # Load chat data
-            chat_key = f"{BROADCASTER_NAME.lower()}/chat_metrics/daily_{date_str}.csv"
-            chat_data = None
-            try:
-                chat_obj = s3_client.get_object(Bucket=AWS_BUCKET_NAME, Key=chat_key)
-                chat_data = pd.read_csv(io.BytesIO(chat_obj['Body'].read()))
-            except Exception as e:
-                logger.warning(f"Could not load chat data from S3: {str(e)}")
-            
-            # Load viewer data
-            viewer_key = f"{BROADCASTER_NAME.lower()}/viewer_stats/daily_{date_str}.csv"
-            viewer_data = None
-            try:
-                viewer_obj = s3_client.get_object(Bucket=AWS_BUCKET_NAME, Key=viewer_key)
-                viewer_data = pd.read_csv(io.BytesIO(viewer_obj['Body'].read()))
-            except Exception as e:
-                logger.warning(f"Could not load viewer data from S3: {str(e)}")
-            
-            # Load subscriber data
-            subs_key = f"{BROADCASTER_NAME.lower()}/subscribers/daily_{date_str}.csv"
-            subs_data = None
-            try:
-                subs_obj = s3_client.get_object(Bucket=AWS_BUCKET_NAME, Key=subs_key)
-                subs_data = pd.read_csv(io.BytesIO(subs_obj['Body'].read()))
-            except Exception as e:
-                logger.warning(f"Could not load subscriber data from S3: {str(e)}")
-            
-            # Load stream metrics
-            stream_key = f"{BROADCASTER_NAME.lower()}/stream_metrics/daily_{date_str}.csv"
-            stream_data = None
-            try:
-                stream_obj = s3_client.get_object(Bucket=AWS_BUCKET_NAME, Key=stream_key)
-                stream_data = pd.read_csv(io.BytesIO(stream_obj['Body'].read()))
-            except Exception as e:
-                logger.warning(f"Could not load stream metrics from S3: {str(e)}")
+            # The four daily files are independent, so fetch them concurrently
+            with ThreadPoolExecutor(max_workers=4) as executor:
+                chat_future = executor.submit(self.load_daily_csv, 'chat_metrics', date_str, "chat data",
+                                              columns=['sender', 'timestamp'])
+                viewer_future = executor.submit(self.load_daily_csv, 'viewer_stats', date_str, "viewer data",
+                                                columns=['timestamp', 'viewer_count'])
+                subs_future = executor.submit(self.load_daily_csv, 'subscribers', date_str, "subscriber data",
+                                              columns=['is_gift', 'tier'])
+                stream_future = executor.submit(self.load_daily_csv, 'stream_metrics', date_str, "stream metrics",
+                                                columns=['timestamp', 'viewer_count', 'stream_duration'])
+            chat_data = chat_future.result()
+            viewer_data = viewer_future.result()
+            subs_data = subs_future.result()
+            stream_data = stream_future.result()
             
             # Generate report
             report = {
@@ -964,43 +1068,49 @@ class TwitchAnalyticsTracker:
                 
                 # Tier distribution
                 if 'tier' in subs_data.columns:
-                    tier_counts = subs_data['tier'].value_counts().to_dict()
+                    tier_counts = {str(tier): int(count) for tier, count in subs_data['tier'].value_counts().items()}
                     report['summary']['tier_distribution'] = tier_counts
             
             # Process chat data
             if chat_data is not None and not chat_data.empty:
                 report['summary']['total_chat_messages'] = len(chat_data)
-                report['summary']['unique_chatters'] = len(chat_data['sender'].unique()) if 'sender' in chat_data.columns else 0
+                report['summary']['unique_chatters'] = int(chat_data['sender'].nunique()) if 'sender' in chat_data.columns else 0
                 
                 # Analyze chat engagement patterns
                 if 'timestamp' in chat_data.columns:
                     chat_data['timestamp'] = pd.to_datetime(chat_data['timestamp'])
-                    chat_data['hour'] = chat_data['timestamp'].dt.hour
                     
-                    # Group by hour and count messages
-                    hourly_counts = chat_data.groupby('hour').size()
-                    if not hourly_counts.empty:
-                        peak_hour = hourly_counts.idxmax()
+                    # Count messages per hour of day
+                    hours = chat_data['timestamp'].dt.hour.dropna().to_numpy(dtype=np.int64)
+                    if len(hours):
+                        peak_hour = int(np.bincount(hours, minlength=24).argmax())
                         report['insights'].append({
                             'type': 'peak_engagement',
                             'message': f"Peak chat engagement occurs around {peak_hour}:00",
-                            'value': int(peak_hour)
+                            'value': peak_hour
                         })
             
             # Process viewer data
             if viewer_data is not None and not viewer_data.empty:
-                report['summary']['peak_viewers'] = viewer_data['viewer_count'].max() if 'viewer_count' in viewer_data.columns else 0
-                report['summary']['avg_viewers'] = viewer_data['viewer_count'].mean() if 'viewer_count' in viewer_data.columns else 0
+                counts = None
+                if 'viewer_count' in viewer_data.columns:
+                    counts = viewer_data['viewer_count'].to_numpy(dtype=np.float64)
+                    peak = np.nanmax(counts) if len(counts) else np.nan
+                    report['summary']['peak_viewers'] = int(peak) if np.isfinite(peak) else 0
+                    report['summary']['avg_viewers'] = float(np.nanmean(counts))
+                else:
+                    report['summary']['peak_viewers'] = 0
+                    report['summary']['avg_viewers'] = 0
                 
                 # Analyze viewer retention
-                if 'timestamp' in viewer_data.columns and len(viewer_data) > 10:
-                    viewer_data['timestamp'] = pd.to_datetime(viewer_data['timestamp'])
-                    viewer_data = viewer_data.sort_values('timestamp')
+                if counts is not None and 'timestamp' in viewer_data.columns and len(counts) > 10:
+                    # Order the counts chronologically instead of sorting the whole DataFrame
+                    counts = sort_by_timestamp(counts, viewer_data['timestamp'].to_numpy(dtype=str))
                     
                     # Calculate viewer retention rate
-                    start_viewers = viewer_data['viewer_count'].iloc[0]
-                    mid_viewers = viewer_data['viewer_count'].iloc[len(viewer_data)//2]
-                    end_viewers = viewer_data['viewer_count'].iloc[-1]
+                    start_viewers = counts[0]
+                    mid_viewers = counts[len(counts)//2]
+                    end_viewers = counts[-1]
                     
                     retention_mid = (mid_viewers / start_viewers) * 100 if start_viewers > 0 else 0
                     retention_end = (end_viewers / start_viewers) * 100 if start_viewers > 0 else 0
@@ -1009,26 +1119,7 @@ class TwitchAnalyticsTracker:
                     report['summary']['retention_end_percent'] = retention_end
                     
                     # Add insights based on retention
-                    if retention_end < 50:
-                        report['insights'].append({
-                            'type': 'retention_issue',
-                            'message': "Strong viewer drop-off detected throughout stream",
-                            'value': retention_end
-                        })
-                        report['recommendations'].append({
-                            'type': 'content_pacing',
-                            'message': "Consider introducing new content segments every 30 minutes to maintain viewer interest and improve algorithm ranking"
-                        })
-                    elif retention_end > 80:
-                        report['insights'].append({
-                            'type': 'retention_positive',
-                            'message': "Excellent viewer retention throughout stream",
-                            'value': retention_end
-                        })
-                        report['recommendations'].append({
-                            'type': 'content_strategy',
-                            'message': "This content format performs well for retention. Consider creating more similar content to maintain algorithm favor."
-                        })
+                    apply_insight_rules(report, RETENTION_RULES, retention_end)
             
             # Process stream metrics
             if stream_data is not None and not stream_data.empty:
@@ -1036,53 +1127,40 @@ class TwitchAnalyticsTracker:
                 
                 # Analyze potential algorithm impact
                 if 'viewer_count' in stream_data.columns and len(stream_data) > 5:
-                    stream_data = stream_data.sort_values('timestamp') if 'timestamp' in stream_data.columns else stream_data
+                    counts = stream_data['viewer_count'].to_numpy(dtype=np.float64)
+                    if 'timestamp' in stream_data.columns:
+                        # Order samples chronologically without copying the DataFrame
+                        counts = sort_by_timestamp(counts, stream_data['timestamp'].to_numpy(dtype=str))
+                    # A missing sample repeats the previous count, as pct_change's forward fill did
+                    counts = pd.Series(counts).ffill().fillna(0).to_numpy()
                     # Check viewer growth pattern
-                    viewer_growth = stream_data['viewer_count'].pct_change().mean() * 100
+                    viewer_growth = average_growth_rate(counts)
                     report['summary']['avg_viewer_growth_pct'] = viewer_growth
                     
-                    if viewer_growth > 5:
-                        report['insights'].append({
-                            'type': 'algorithm_boost',
-                            'message': "Strong positive viewer growth rate indicates algorithm favor",
-                            'value': viewer_growth
-                        })
-                        report['recommendations'].append({
-                            'type': 'stream_duration',
-                            'message': "Consider extending streams by 30-60 minutes to capitalize on algorithm boost and increase discoverability"
-                        })
-                    elif viewer_growth < -5:
-                        report['insights'].append({
-                            'type': 'algorithm_concern',
-                            'message': "Negative viewer trend may indicate algorithm deprioritization",
-                            'value': viewer_growth
-                        })
-                        report['recommendations'].append({
-                            'type': 'content_variety',
-                            'message': "Increase content variety and engagement prompts to boost algorithm metrics"
-                        })
+                    apply_insight_rules(report, VIEWER_GROWTH_RULES, viewer_growth)
             
             # Save report directly to S3
-            report_key = f"{BROADCASTER_NAME.lower()}/reports/daily_report_{date_str}.json"
-            s3_client.put_object(
-                Bucket=AWS_BUCKET_NAME,
-                Key=report_key,
-                Body=json.dumps(report, indent=4),
-                ContentType='application/json'
-            )
+            report_key = f"{self._broadcaster_prefix}/reports/daily_report_{date_str}.json.gz"
+            self.put_json(report_key, report, compress=True)
             
-            logger.info(f"Generated daily report for {date_str} and saved directly to S3")
+            logger.info("Generated daily report for %s and saved directly to S3", date_str)
             return report
         
         except Exception as e:
-            logger.error(f"Error generating daily report: {str(e)}")
+            logger.error("Error generating daily report: %s", e)
             return None
 
     async def check_stream_status(self):
         """Check if the broadcaster is currently live with immediate S3 update"""
         try:
-            stream_info = twitch.get_streams(user_id=[broadcaster_id])
-            timestamp = datetime.datetime.now().isoformat()
+            stream_info = await asyncio.to_thread(twitch.get_streams, user_id=[broadcaster_id])
+            
+            # Read the clock once per tick and derive every timestamp/key part from it
+            now = datetime.datetime.now()
+            now_utc = now.astimezone(datetime.timezone.utc)
+            timestamp = now.isoformat()
+            date_str, time_str = now.strftime("%Y%m%d %H%M%S").split()
+            was_live = live_metrics['is_live']
             
             status_data = {
                 'timestamp': timestamp,
@@ -1106,10 +1184,12 @@ class TwitchAnalyticsTracker:
                     # Stream just started
                     live_metrics['is_live'] = True
                     live_metrics['stream_started_at'] = stream_data['started_at']
+                    self._stream_start_dt = parse_twitch_timestamp(stream_data['started_at'])
+                    self._chatters.clear()
                     live_metrics['current_viewers'] = stream_data['viewer_count']
                     live_metrics['peak_viewers'] = stream_data['viewer_count']
                     
-                    logger.info(f"Stream started at {stream_data['started_at']}")
+                    logger.info("Stream started at %s", stream_data['started_at'])
                     
                     # Add to recent events
                     live_metrics['recent_events'].append({
@@ -1127,13 +1207,8 @@ class TwitchAnalyticsTracker:
                         'started_at': stream_data['started_at']
                     }
                     
-                    s3_key = f"{BROADCASTER_NAME.lower()}/stream_metrics/{datetime.datetime.now().strftime('%Y%m%d')}/stream_start.json"
-                    s3_client.put_object(
-                        Bucket=AWS_BUCKET_NAME,
-                        Key=s3_key,
-                        Body=json.dumps(start_event),
-                        ContentType='application/json'
-                    )
+                    s3_key = f"{self._broadcaster_prefix}/stream_metrics/{date_str}/stream_start.json"
+                    await self.enqueue_upload(s3_key, dump_json(start_event), 'application/json')
                 else:
                     # Update current metrics
                     live_metrics['current_viewers'] = stream_data['viewer_count']
@@ -1145,50 +1220,35 @@ class TwitchAnalyticsTracker:
                         'viewer_count': stream_data['viewer_count']
                     })
                     
-                    # Keep only the last 60 data points
-                    if len(live_metrics['viewer_retention']) > 60:
-                        live_metrics['viewer_retention'] = live_metrics['viewer_retention'][-60:]
-                    
                     # Add to stream metrics for historical tracking
-                    stream_metrics.append({
+                    self.stream_metrics.append({
                         'timestamp': timestamp,
                         'viewer_count': stream_data['viewer_count'],
-                        'stream_duration': (datetime.datetime.now() - datetime.datetime.fromisoformat(
-                            live_metrics['stream_started_at'].replace('Z', '+00:00')
-                        )).total_seconds() / 60,  # Duration in minutes
+                        'stream_duration': (now_utc - self._stream_start_dt).total_seconds() / 60,  # Duration in minutes
                         'game_id': stream_data['game_id'],
                         'stream_id': stream_data['id']
                     })
                     
                     # Add to viewer counts for historical tracking
-                    viewer_counts.append({
+                    self.viewer_counts.append({
                         'timestamp': timestamp,
                         'viewer_count': stream_data['viewer_count'],
                         'stream_id': stream_data['id']
                     })
                     
-                    # Immediately save the current viewer count to S3
-                    viewer_data = {
-                        'timestamp': timestamp,
-                        'viewer_count': stream_data['viewer_count'],
-                        'stream_id': stream_data['id']
-                    }
+                    # Viewer counts reach S3 in the batches below rather than one object per tick
+                    uploads = []
+                    if len(self.viewer_counts) >= 10:
+                        uploads.append(self.save_viewer_stats())
                     
-                    # Save directly to S3
-                    s3_key = f"{BROADCASTER_NAME.lower()}/viewer_stats/{datetime.datetime.now().strftime('%Y%m%d')}/viewer_count_{datetime.datetime.now().strftime('%H%M%S')}.json"
-                    s3_client.put_object(
-                        Bucket=AWS_BUCKET_NAME,
-                        Key=s3_key,
-                        Body=json.dumps(viewer_data),
-                        ContentType='application/json'
-                    )
-                    
-                    # Save data in batches for efficiency
-                    if len(viewer_counts) >= 10:
-                        await self.save_viewer_stats()
+                    if len(self.stream_metrics) >= 10:
+                        uploads.append(self.save_stream_metrics())
                     
-                    if len(stream_metrics) >= 10:
-                        await self.save_stream_metrics()
+                    # Overlap the uploads instead of paying each round-trip in turn; a failed
+                    # flush keeps its batch and must not stop this tick's status write
+                    for result in await asyncio.gather(*uploads, return_exceptions=True):
+                        if isinstance(result, Exception):
+                            logger.error("Error flushing metrics to S3: %s", result)
             else:
                 # Streamer is not live
                 if live_metrics['is_live']:
@@ -1196,9 +1256,9 @@ class TwitchAnalyticsTracker:
                     live_metrics['is_live'] = False
                     
                     # Calculate stream duration
-                    if live_metrics['stream_started_at']:
-                        start_time = datetime.datetime.fromisoformat(live_metrics['stream_started_at'].replace('Z', '+00:00'))
-                        end_time = datetime.datetime.now(datetime.timezone.utc)
+                    if self._stream_start_dt:
+                        start_time = self._stream_start_dt
+                        end_time = now_utc
                         duration_minutes = int((end_time - start_time).total_seconds() / 60)
                         
                         # Add stream end event
@@ -1220,74 +1280,61 @@ class TwitchAnalyticsTracker:
                             'total_chat_messages': live_metrics['total_chat_messages']
                         }
                         
-                        s3_key = f"{BROADCASTER_NAME.lower()}/stream_metrics/{datetime.datetime.now().strftime('%Y%m%d')}/stream_end.json"
-                        s3_client.put_object(
-                            Bucket=AWS_BUCKET_NAME,
-                            Key=s3_key,
-                            Body=json.dumps(stream_end_data),
-                            ContentType='application/json'
-                        )
+                        s3_key = f"{self._broadcaster_prefix}/stream_metrics/{date_str}/stream_end.json"
+                        await self.enqueue_upload(s3_key, dump_json(stream_end_data), 'application/json')
                     
-                    # Save final metrics
-                    await self.save_viewer_stats()
-                    await self.save_stream_metrics()
-                    await self.save_chat_metrics()
+                    # Save final metrics concurrently; the stream-end status below is written
+                    # even if one of the flushes fails
+                    results = await asyncio.gather(
+                        self.save_viewer_stats(),
+                        self.save_stream_metrics(),
+                        self.save_chat_metrics(),
+                        return_exceptions=True
+                    )
+                    for result in results:
+                        if isinstance(result, Exception):
+                            logger.error("Error flushing final metrics to S3: %s", result)
                     
                     logger.info("Stream ended, all metrics saved to S3")
             
-            # Save stream status to S3 for monitoring
-            date_str = datetime.datetime.now().strftime("%Y%m%d")
-            s3_key = f"{BROADCASTER_NAME.lower()}/status/stream_status_{date_str}.json"
-            
-            try:
-                # Check if file exists
-                try:
-                    existing_obj = s3_client.get_object(Bucket=AWS_BUCKET_NAME, Key=s3_key)
-                    existing_content = existing_obj['Body'].read().decode('utf-8')
-                    
-                    # Parse existing content and append new status
-                    try:
-                        existing_data = json.loads(existing_content)
-                        if isinstance(existing_data, list):
-                            existing_data.append(status_data)
-                        else:
-                            existing_data = [existing_data, status_data]
-                    except:
-                        # If parsing fails, start a new array
-                        existing_data = [status_data]
+            # Save stream status to S3 for monitoring. Each check writes its own one-line
+            # NDJSON object, so a tick costs one small PUT instead of re-uploading the whole
+            # day; concatenating the day's prefix yields the full status log.
+            # While offline only the transition and one marker per day are written.
+            if status_data['is_live'] or was_live or self._last_saved_offline_date != date_str:
+                s3_key = f"{self._broadcaster_prefix}/status/{date_str}/stream_status_{time_str}.jsonl"
+                
+                status_body = dump_json(status_data) + b'\n'
+                if status_data['is_live']:
+                    await self.enqueue_upload(s3_key, status_body, 'application/x-ndjson')
+                else:
+                    # The day's offline marker only counts as written once it reaches S3
+                    def mark_offline_saved(date_str=date_str):
+                        self._last_saved_offline_date = date_str
                     
-                    # Save updated content
-                    s3_client.put_object(
-                        Bucket=AWS_BUCKET_NAME,
-                        Key=s3_key,
-                        Body=json.dumps(existing_data),
-                        ContentType='application/json'
-                    )
-                except:
-                    # File doesn't exist, create new
-                    s3_client.put_object(
-                        Bucket=AWS_BUCKET_NAME,
-                        Key=s3_key,
-                        Body=json.dumps([status_data]),
-                        ContentType='application/json'
+                    await self.enqueue_upload(
+                        s3_key, status_body, 'application/x-ndjson', on_success=mark_offline_saved
                     )
-            except Exception as e:
-                logger.error(f"Error saving stream status to S3: {str(e)}")
         
         except Exception as e:
-            logger.error(f"Error checking stream status: {str(e)}")
+            logger.error("Error checking stream status: %s", e)
 
     async def get_subscriber_count(self):
         """Get the current subscriber count with immediate S3 save"""
         try:
             # Get subscriber count from Twitch API
-            sub_response = twitch.get_broadcaster_subscriptions(broadcaster_id=broadcaster_id)
-            timestamp = datetime.datetime.now().isoformat()
+            sub_response = await asyncio.to_thread(twitch.get_broadcaster_subscriptions, broadcaster_id=broadcaster_id)
+            now = datetime.datetime.now()
+            timestamp = now.isoformat()
             
             if 'total' in sub_response:
                 sub_count = sub_response['total']
                 live_metrics['subscriber_count'] = sub_count
-                logger.info(f"Current subscriber count: {live_metrics['subscriber_count']}")
+                logger.info("Current subscriber count: %s", live_metrics['subscriber_count'])
+                
+                # Only record changes; readers carry the last value forward
+                if sub_count == self._last_saved_sub_count:
+                    return
                 
                 # Save subscriber count data directly to S3
                 sub_count_data = {
@@ -1295,22 +1342,24 @@ class TwitchAnalyticsTracker:
                     'subscriber_count': sub_count
                 }
                 
-                date_str = datetime.datetime.now().strftime("%Y%m%d")
-                s3_key = f"{BROADCASTER_NAME.lower()}/subscribers/{date_str}/count_{datetime.datetime.now().strftime('%H%M%S')}.json"
-                s3_client.put_object(
+                date_str, time_str = now.strftime("%Y%m%d %H%M%S").split()
+                s3_key = f"{self._broadcaster_prefix}/subscribers/{date_str}/count_{time_str}.json"
+                await asyncio.to_thread(
+                    s3_client.put_object,
                     Bucket=AWS_BUCKET_NAME,
                     Key=s3_key,
-                    Body=json.dumps(sub_count_data),
+                    Body=dump_json(sub_count_data),
                     ContentType='application/json'
                 )
+                self._last_saved_sub_count = sub_count
         except Exception as e:
-            logger.error(f"Error getting subscriber count: {str(e)}")
+            logger.error("Error getting subscriber count: %s", e)
 
     async def analyze_top_clips(self):
         """Analyze top clips and save results directly to S3"""
         try:
             # Get top clips for the channel
-            clips = twitch.get_clips(broadcaster_id=broadcaster_id, first=20)
+            clips = await asyncio.to_thread(twitch.get_clips, broadcaster_id=broadcaster_id, first=20)
             
             if 'data' in clips and clips['data']:
                 date_str = datetime.datetime.now().strftime("%Y%m%d")
@@ -1329,102 +1378,123 @@ class TwitchAnalyticsTracker:
                     })
                 
                 # Save clips data directly to S3
-                clips_key = f"{BROADCASTER_NAME.lower()}/clip_analysis/top_clips_{date_str}.json"
-                s3_client.put_object(
-                    Bucket=AWS_BUCKET_NAME,
-                    Key=clips_key,
-                    Body=json.dumps(clip_data, indent=4),
-                    ContentType='application/json'
-                )
+                clips_key = f"{self._broadcaster_prefix}/clip_analysis/top_clips_{date_str}.json.gz"
+                await asyncio.to_thread(self.put_json, clips_key, clip_data, compress=True)
                 
                 # Analyze clips for insights
                 if clip_data:
-                    # Sort by view count
-                    sorted_clips = sorted(clip_data, key=lambda x: x['view_count'], reverse=True)
+                    # Pull the numeric stats into column arrays
+                    durations = np.fromiter((clip['duration'] for clip in clip_data), dtype=np.float64, count=len(clip_data))
+                    views = np.fromiter((clip['view_count'] for clip in clip_data), dtype=np.int64, count=len(clip_data))
                     
-                    # Find most popular game
-                    game_counts = {}
-                    for clip in sorted_clips:
-                        game_id = clip.get('game_id', 'unknown')
-                        game_counts[game_id] = game_counts.get(game_id, 0) + 1
+                    # Sort by view count (stable, so ties keep the API order)
+                    sorted_clips = [clip_data[i] for i in np.argsort(-views, kind='stable')]
                     
-                    most_popular_game = max(game_counts.items(), key=lambda x: x[1])[0]
+                    # Find most popular game
+                    game_counts = Counter(clip.get('game_id', 'unknown') for clip in sorted_clips)
+                    top_games = game_counts.most_common(5)
+                    most_popular_game = top_games[0][0]
                     
                     # Find average clip duration
-                    avg_duration = sum(clip['duration'] for clip in sorted_clips) / len(sorted_clips)
+                    avg_duration = float(durations.mean())
                     
                     # Log insights
-                    logger.info(f"Top clip analysis: Most popular game ID: {most_popular_game}")
-                    logger.info(f"Top clip analysis: Average clip duration: {avg_duration:.2f} seconds")
+                    logger.info("Top clip analysis: Most popular game ID: %s", most_popular_game)
+                    logger.info("Top clip analysis: Average clip duration: %.2f seconds", avg_duration)
                     
                     # Save analysis results directly to S3
                     analysis_results = {
                         'date': date_str,
                         'most_popular_game': most_popular_game,
+                        'top_games': [{'game_id': game_id, 'clip_count': count} for game_id, count in top_games],
                         'avg_duration': avg_duration,
                         'top_5_clips': sorted_clips[:5]
                     }
                     
-                    analysis_key = f"{BROADCASTER_NAME.lower()}/clip_analysis/analysis_{date_str}.json"
-                    s3_client.put_object(
-                        Bucket=AWS_BUCKET_NAME,
-                        Key=analysis_key,
-                        Body=json.dumps(analysis_results, indent=4),
-                        ContentType='application/json'
-                    )
+                    analysis_key = f"{self._broadcaster_prefix}/clip_analysis/analysis_{date_str}.json.gz"
+                    await asyncio.to_thread(self.put_json, analysis_key, analysis_results, compress=True)
                     
                     # Return insights for potential recommendations
                     return analysis_results
             
             return None
         except Exception as e:
-            logger.error(f"Error analyzing top clips: {str(e)}")
+            logger.error("Error analyzing top clips: %s", e)
             return None
 
+    async def run_periodically(self, job, interval_seconds):
+        """Await job every interval_seconds on the running event loop"""
+        while True:
+            await asyncio.sleep(interval_seconds)
+            try:
+                await job()
+            except Exception as e:
+                logger.error("Scheduled task failed: %s", e)
+
+    async def run_daily(self, job, at_time):
+        """Await job once a day at the given local HH:MM time"""
+        hour, minute = map(int, at_time.split(':'))
+        while True:
+            now = datetime.datetime.now()
+            next_run = now.replace(hour=hour, minute=minute, second=0, microsecond=0)
+            if next_run <= now:
+                next_run += datetime.timedelta(days=1)
+            await asyncio.sleep((next_run - now).total_seconds())
+            try:
+                await job()
+            except Exception as e:
+                logger.error("Scheduled daily task failed: %s", e)
+
     def schedule_tasks(self):
-        """Schedule recurring tasks"""
-        # Check stream status every minute
-        schedule.every(1).minutes.do(lambda: asyncio.run(self.check_stream_status()))
-        
-        # Update subscriber count every 15 minutes
-        schedule.every(15).minutes.do(lambda: asyncio.run(self.get_subscriber_count()))
-        
-        # Analyze top clips once a day
-        schedule.every().day.at("04:00").do(lambda: asyncio.run(self.analyze_top_clips()))
-        
-        # Generate daily report at midnight
-        schedule.every().day.at("00:01").do(self.generate_daily_report)
-        
-        # Run the scheduler in a separate thread
-        def run_scheduler():
-            while True:
-                schedule.run_pending()
-                time.sleep(1)
-        
-        scheduler_thread = threading.Thread(target=run_scheduler)
-        scheduler_thread.daemon = True
-        scheduler_thread.start()
+        """Schedule recurring tasks on the running event loop"""
+        self._tasks = [
+            # Check stream status every minute
+            asyncio.create_task(self.run_periodically(self.check_stream_status, 60)),
+            
+            # Update subscriber count every 15 minutes
+            asyncio.create_task(self.run_periodically(self.get_subscriber_count, 15 * 60)),
+            
+            # Analyze top clips once a day
+            asyncio.create_task(self.run_daily(self.analyze_top_clips, "04:00")),
+            
+            # Generate daily report at midnight; it does blocking S3 reads and pandas work
+            asyncio.create_task(self.run_daily(
+                lambda: asyncio.to_thread(self.generate_daily_report), "00:01"
+            )),
+        ]
         
         logger.info("Scheduled tasks initialized")
 
     async def run(self):
         """Run the Twitch Analytics Tracker"""
-        # Connect to Twitch chat
-        await self.connect_to_chat()
-        
-        # Schedule recurring tasks
-        self.schedule_tasks()
-        
-        # Initial checks
-        await self.check_stream_status()
-        await self.get_subscriber_count()
-        await self.analyze_top_clips()
-        
-        logger.info("Twitch Analytics Tracker is running")
+        # Start the background S3 upload workers before anything produces uploads
+        self._upload_workers = [
+            asyncio.create_task(self.upload_worker()) for _ in range(UPLOAD_WORKERS)
+        ]
+        self._tasks = []
         
-        # Keep the chat connection alive
-        while True:
-            await asyncio.sleep(60)
+        try:
+            # Connect to Twitch chat
+            await self.connect_to_chat()
+            
+            # Schedule recurring tasks
+            self.schedule_tasks()
+            
+            # Initial checks
+            await self.check_stream_status()
+            await self.get_subscriber_count()
+            await self.analyze_top_clips()
+            
+            logger.info("Twitch Analytics Tracker is running")
+            
+            # Keep the chat connection alive
+            while True:
+                await asyncio.sleep(60)
+        finally:
+            # Stop producing new uploads, then flush the ones already queued
+            for task in self._tasks:
+                task.cancel()
+            await self.stop_upload_workers()
 
 
 # Create HTML template for the web dashboard
@@ -1655,7 +1725,7 @@ def create_html_template():
         with open(index_path, 'w') as f:
             f.write(html_content)
         
-        logger.info(f"Created HTML template at {index_path}")
+        logger.info("Created HTML template at %s", index_path)
 
 def start_flask_server():
     """Start the Flask server in a separate thread"""
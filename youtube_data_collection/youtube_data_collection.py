@@ -2,13 +2,45 @@ import os
 import csv
 import datetime
 import time
-from typing import Dict, List, Any
+from typing import Dict, List, Any, Iterable, Iterator
 
 import googleapiclient.discovery
 import googleapiclient.errors
 import boto3
+from boto3.s3.transfer import TransferConfig, create_transfer_manager
+from botocore.config import Config
 from botocore.exceptions import NoCredentialsError, ClientError
 
+# Retries for transient API failures (5xx, rate limits), with exponential backoff
+API_RETRIES = 5
+
+# videos().list accepts at most this many IDs per request
+MAX_IDS_PER_REQUEST = 50
+
+# Built API clients, keyed by API key
+_youtube_clients: Dict[str, Any] = {}
+
+
+def get_youtube_client(api_key: str):
+    """
+    Get a YouTube Data API client, building it only once per API key.
+    
+    Args:
+        api_key: YouTube Data API key
+        
+    Returns:
+        YouTube Data API v3 resource
+    """
+    client = _youtube_clients.get(api_key)
+    if client is None:
+        # Discovery is cached here in-process, so skip the library's own file cache
+        client = googleapiclient.discovery.build(
+            "youtube", "v3", developerKey=api_key, cache_discovery=False
+        )
+        _youtube_clients[api_key] = client
+    return client
+
+
 class YouTubeAnalyticsTracker:
     def __init__(self, api_key: str, channel_id: str):
         """
@@ -20,9 +52,9 @@ class YouTubeAnalyticsTracker:
         """
         self.api_key = api_key
         self.channel_id = channel_id
-        self.youtube = googleapiclient.discovery.build(
-            "youtube", "v3", developerKey=api_key
-        )
+        self.youtube = get_youtube_client(api_key)
+        # Filled in by the first channels().list response
+        self._uploads_playlist_id = None
         
     def get_channel_statistics(self) -> Dict[str, Any]:
         """
@@ -35,13 +67,14 @@ class YouTubeAnalyticsTracker:
             part="snippet,contentDetails,statistics",
             id=self.channel_id
         )
-        response = request.execute()
+        response = request.execute(num_retries=API_RETRIES)
         
         if not response['items']:
             raise ValueError(f"No channel found with ID: {self.channel_id}")
             
         channel_data = response['items'][0]
         stats = channel_data['statistics']
+        self._uploads_playlist_id = channel_data['contentDetails']['relatedPlaylists']['uploads']
         
         return {
             'timestamp': datetime.datetime.now().isoformat(),
@@ -61,25 +94,26 @@ class YouTubeAnalyticsTracker:
         Returns:
             List of video data dictionaries
         """
-        # Get upload playlist ID (all channel videos)
-        request = self.youtube.channels().list(
-            part="contentDetails",
-            id=self.channel_id
-        )
-        response = request.execute()
-        
-        if not response['items']:
-            raise ValueError(f"No channel found with ID: {self.channel_id}")
+        # Get upload playlist ID (all channel videos), unless the channel was already fetched
+        if self._uploads_playlist_id is None:
+            request = self.youtube.channels().list(
+                part="contentDetails",
+                id=self.channel_id
+            )
+            response = request.execute(num_retries=API_RETRIES)
             
-        uploads_playlist_id = response['items'][0]['contentDetails']['relatedPlaylists']['uploads']
+            if not response['items']:
+                raise ValueError(f"No channel found with ID: {self.channel_id}")
+                
+            self._uploads_playlist_id = response['items'][0]['contentDetails']['relatedPlaylists']['uploads']
         
         # Get videos from uploads playlist
         request = self.youtube.playlistItems().list(
             part="snippet,contentDetails",
-            playlistId=uploads_playlist_id,
+            playlistId=self._uploads_playlist_id,
             maxResults=max_results
         )
-        response = request.execute()
+        response = request.execute(num_retries=API_RETRIES)
         
         videos = []
         for item in response.get('items', []):
@@ -103,33 +137,40 @@ class YouTubeAnalyticsTracker:
         Returns:
             List of video analytics dictionaries
         """
-        if not video_ids:
-            return []
-            
-        # Make a batch request for efficiency
-        videos_request = self.youtube.videos().list(
-            part="statistics,snippet",
-            id=','.join(video_ids)
-        )
-        videos_response = videos_request.execute()
+        return list(self.iter_video_analytics(video_ids))
+    
+    def iter_video_analytics(self, video_ids: List[str]) -> Iterator[Dict[str, Any]]:
+        """
+        Yield detailed analytics for specified videos as each response arrives.
         
-        video_analytics = []
-        for item in videos_response.get('items', []):
-            video_id = item['id']
-            statistics = item['statistics']
+        Args:
+            video_ids: List of YouTube video IDs
             
-            analytics = {
-                'video_id': video_id,
-                'title': item['snippet']['title'],
-                'published_at': item['snippet']['publishedAt'],
-                'view_count': statistics.get('viewCount', '0'),
-                'like_count': statistics.get('likeCount', '0'),
-                'comment_count': statistics.get('commentCount', '0'),
-                'timestamp': datetime.datetime.now().isoformat()
-            }
-            video_analytics.append(analytics)
+        Yields:
+            Video analytics dictionaries
+        """
+        # Make batch requests of up to 50 IDs each for efficiency
+        for start in range(0, len(video_ids), MAX_IDS_PER_REQUEST):
+            videos_request = self.youtube.videos().list(
+                part="statistics,snippet",
+                id=','.join(video_ids[start:start + MAX_IDS_PER_REQUEST])
+            )
+            videos_response = videos_request.execute(num_retries=API_RETRIES)
             
-        return video_analytics
+            # One fetch time for the whole response
+            timestamp = datetime.datetime.now().isoformat()
+            for item in videos_response.get('items', []):
+                statistics = item['statistics']
+                
+                yield {
+                    'video_id': item['id'],
+                    'title': item['snippet']['title'],
+                    'published_at': item['snippet']['publishedAt'],
+                    'view_count': statistics.get('viewCount', '0'),
+                    'like_count': statistics.get('likeCount', '0'),
+                    'comment_count': statistics.get('commentCount', '0'),
+                    'timestamp': timestamp
+                }
     
     def get_comment_engagement(self, video_id: str, max_results: int = 20) -> List[Dict[str, Any]]:
         """
@@ -149,7 +190,7 @@ class YouTubeAnalyticsTracker:
                 maxResults=max_results,
                 order="relevance"
             )
-            response = request.execute()
+            response = request.execute(num_retries=API_RETRIES)
             
             comments = []
             for item in response.get('items', []):
@@ -179,18 +220,20 @@ class DataExporter:
         self.output_dir = output_dir
         os.makedirs(output_dir, exist_ok=True)
     
-    def export_to_csv(self, data: List[Dict[str, Any]], filename: str) -> str:
+    def export_to_csv(self, data: Iterable[Dict[str, Any]], filename: str) -> str:
         """
         Export data to a CSV file.
         
         Args:
-            data: List of dictionaries to export
+            data: List or iterator of dictionaries to export; the first row sets the columns
             filename: Name of the CSV file (without .csv extension)
             
         Returns:
             Full path to the created CSV file
         """
-        if not data:
+        rows = iter(data)
+        first_row = next(rows, None)
+        if first_row is None:
             print(f"No data to export for {filename}")
             return None
             
@@ -198,13 +241,23 @@ class DataExporter:
         full_filename = f"{filename}_{timestamp}.csv"
         file_path = os.path.join(self.output_dir, full_filename)
         
-        with open(file_path, 'w', newline='', encoding='utf-8') as csvfile:
-            fieldnames = data[0].keys()
-            writer = csv.DictWriter(csvfile, fieldnames=fieldnames)
-            
-            writer.writeheader()
-            for row in data:
-                writer.writerow(row)
+        # Rows may still be fetched while writing, so build the file under a temporary
+        # name and only move it into place once every row has been written
+        tmp_path = file_path + '.tmp'
+        try:
+            # A 1 MiB buffer turns many small row writes into a few large ones
+            with open(tmp_path, 'w', newline='', encoding='utf-8', buffering=1024 * 1024) as csvfile:
+                fieldnames = first_row.keys()
+                writer = csv.DictWriter(csvfile, fieldnames=fieldnames)
+                
+                writer.writeheader()
+                writer.writerow(first_row)
+                writer.writerows(rows)
+        except BaseException:
+            if os.path.exists(tmp_path):
+                os.remove(tmp_path)
+            raise
+        os.replace(tmp_path, file_path)
                 
         print(f"Data exported to {file_path}")
         return file_path
@@ -224,7 +277,16 @@ class AWSUploader:
             's3',
             aws_access_key_id=aws_access_key,
             aws_secret_access_key=aws_secret_key,
-            region_name=region
+            region_name=region,
+            # botocore counts the first try in max_attempts, so this matches the API retries
+            config=Config(retries={'max_attempts': API_RETRIES + 1, 'mode': 'standard'})
+        )
+        # Split large exports into 16 MiB parts uploaded in parallel
+        self.transfer_config = TransferConfig(
+            multipart_threshold=8 * 1024 * 1024,
+            multipart_chunksize=16 * 1024 * 1024,
+            max_concurrency=10,
+            use_threads=True
         )
     
     def upload_file(self, file_path: str, bucket_name: str, object_name: str = None) -> bool:
@@ -242,8 +304,52 @@ class AWSUploader:
         if object_name is None:
             object_name = os.path.basename(file_path)
             
+        return self._finish_upload(
+            lambda: self.s3_client.upload_file(file_path, bucket_name, object_name, Config=self.transfer_config),
+            file_path, bucket_name, object_name
+        )
+    
+    def upload_files(self, file_paths: List[str], bucket_name: str) -> Dict[str, bool]:
+        """
+        Upload several files to an S3 bucket concurrently.
+        
+        Args:
+            file_paths: Paths of the files to upload
+            bucket_name: Name of the S3 bucket
+            
+        Returns:
+            Dictionary mapping each file path to whether its upload succeeded
+        """
+        if not file_paths:
+            return {}
+            
+        # One transfer manager schedules the parts of every file on a shared thread pool
+        with create_transfer_manager(self.s3_client, self.transfer_config) as manager:
+            uploads = []
+            for file_path in file_paths:
+                object_name = os.path.basename(file_path)
+                uploads.append((file_path, object_name, manager.upload(file_path, bucket_name, object_name)))
+                
+            return {
+                file_path: self._finish_upload(future.result, file_path, bucket_name, object_name)
+                for file_path, object_name, future in uploads
+            }
+    
+    def _finish_upload(self, upload, file_path: str, bucket_name: str, object_name: str) -> bool:
+        """
+        Run or wait on an upload and report its outcome.
+        
+        Args:
+            upload: Callable that performs or waits for the upload
+            file_path: Path of the file being uploaded
+            bucket_name: Name of the S3 bucket
+            object_name: S3 object name
+            
+        Returns:
+            True if upload was successful, False otherwise
+        """
         try:
-            self.s3_client.upload_file(file_path, bucket_name, object_name)
+            upload()
             print(f"Successfully uploaded {file_path} to {bucket_name}/{object_name}")
             return True
         except FileNotFoundError:
@@ -283,25 +389,21 @@ def main():
         # Get video IDs from recent videos
         video_ids = [video['video_id'] for video in recent_videos]
         
-        # Get video analytics
-        video_analytics = tracker.get_video_analytics(video_ids)
+        # Stream video analytics straight into the CSV as the responses arrive
+        video_analytics = tracker.iter_video_analytics(video_ids)
         analytics_file = exporter.export_to_csv(video_analytics, "video_analytics")
         
         # Get comments for the most recent video (if available)
+        comments_file = None
         if video_ids:
             comments = tracker.get_comment_engagement(video_ids[0])
-            if comments:
-                comments_file = exporter.export_to_csv(comments, f"comments_{video_ids[0]}")
-                if comments_file:
-                    uploader.upload_file(comments_file, AWS_BUCKET_NAME)
+            comments_file = exporter.export_to_csv(comments, f"comments_{video_ids[0]}")
         
-        # Upload all files to AWS
-        if channel_stats_file:
-            uploader.upload_file(channel_stats_file, AWS_BUCKET_NAME)
-        if videos_file:
-            uploader.upload_file(videos_file, AWS_BUCKET_NAME)
-        if analytics_file:
-            uploader.upload_file(analytics_file, AWS_BUCKET_NAME)
+        # Upload every exported file to AWS in one concurrent batch
+        export_files = [
+            path for path in (channel_stats_file, videos_file, analytics_file, comments_file) if path
+        ]
+        uploader.upload_files(export_files, AWS_BUCKET_NAME)
             
         print("Analytics tracking and upload completed successfully!")
         